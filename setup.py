@@ -58,6 +58,9 @@ setup(
         "setuptools",
         "argcomplete",
         "dataclasses",
+        # The importlib.metadata entry_points() selection API is only in the
+        # standard library starting with 3.10.
+        "importlib_metadata>=3.6; python_version<'3.10'",
     ],
     url="https://github.com/oracle/yo",
     author="Oracle",
@@ -33,6 +33,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import argparse
 import contextlib
 import dataclasses
 import datetime
@@ -46,11 +47,16 @@ from tests.testing.factories import instance_factory
 from tests.testing.factories import NOT_MY_EMAIL
 from tests.testing.factories import oci_instance_factory
 from tests.testing.factories import oci_instance_fromyo
+from tests.testing.factories import oci_volume_attachment_factory
 from tests.testing.factories import short_name
+from tests.testing.factories import volume_factory
 from tests.testing.fake_oci import FakeOCI
 from tests.testing.rich import FakeTable
 from yo.api import now
+from yo.api import VolumeKind
 from yo.api import YoCtx
+from yo.api import YoVolumeAttachment
+from yo.main import do_detach_volume
 from yo.util import YoExc
 
 
@@ -192,3 +198,67 @@ def test_get_instance_by_name_two(ctx, fake):
     )
     fake.compute.list_instances.assert_called_once()
     fake.compute.get_instance.assert_not_called()
+
+
+@pytest.mark.parametrize("state", ["RUNNING", "TERMINATED"])
+def test_instance_exists(ctx, fake, state):
+    # The cache is empty, so we expect the API to be consulted, and terminated
+    # instances to be ignored by default.
+    inst = instance_factory(state=state)
+    set_cache(ctx, "instances", [])
+    fake.compute._instances = [oci_instance_fromyo(inst)]
+    assert ctx.instance_exists(inst.name) == (state != "TERMINATED")
+    assert ctx.instance_exists(inst.name, exclude_terminated=False)
+    assert not ctx.instance_exists(inst.name + "-other")
+    fake.compute.list_instances.assert_called_with(
+        ctx.config.instance_compartment_id,
+        display_name=inst.name + "-other",
+    )
+
+
+def test_instance_exists_other_creator(ctx, fake):
+    inst = oci_instance_factory(created_by=NOT_MY_EMAIL)
+    fake.compute._instances = [inst]
+    assert not ctx.instance_exists(inst.display_name)
+
+
+def test_get_volumes(ctx):
+    boot = volume_factory(
+        name="test-vm (Boot Volume)", alt_name="test-vm", kind=VolumeKind.BOOT
+    )
+    a = volume_factory()
+    b = volume_factory()
+    gone = volume_factory(state="TERMINATED")
+    with mock.patch.object(ctx, "list_volumes", return_value=[a, boot, b]):
+        assert ctx.get_volumes([b.name, a.name, b.name]) == [b, a]
+        assert ctx.get_volumes(["test-vm", boot.name]) == [boot]
+        assert ctx.get_volumes(["test-vm"], kind=VolumeKind.BOOT) == [boot]
+        with pytest.raises(YoExc, match="no BLOCK volume with name test-vm"):
+            ctx.get_volumes([a.name, "test-vm"], kind=VolumeKind.BLOCK)
+    with mock.patch.object(ctx, "list_volumes", return_value=[a, gone, a]):
+        with pytest.raises(YoExc, match="no volume with name"):
+            ctx.get_volumes([gone.name])
+        with pytest.raises(YoExc, match="multiple volumes with name"):
+            ctx.get_volumes([a.name])
+
+
+@pytest.mark.parametrize("parallel_waits", [True, False])
+def test_detach_volumes_wait(ctx, fake, parallel_waits):
+    ctx.config.parallel_waits = parallel_waits
+    oci_vas = [oci_volume_attachment_factory() for _ in range(2)]
+    fake.compute._volume_attachments = oci_vas
+    vas = [YoVolumeAttachment.from_oci_block(va) for va in oci_vas]
+    set_cache(ctx, "vas", vas)
+    with ctx:
+        do_detach_volume(ctx, argparse.Namespace(teardown=True), vas)
+
+    assert fake.compute.detach_volume.call_count == 2
+    if parallel_waits:
+        ctx.oci.wait_until_progress_many.assert_called_once()
+        assert ctx.oci.wait_until_progress_many.call_args[0][2] is ctx._tpe
+        ctx.oci.wait_until_progress.assert_not_called()
+    else:
+        ctx.oci.wait_until_progress_many.assert_not_called()
+        assert ctx.oci.wait_until_progress.call_count == 2
+    for va in vas:
+        assert ctx._vas.get_by_id(va.id).state == "DETACHED"
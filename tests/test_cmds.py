@@ -33,6 +33,8 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import argparse
+import concurrent.futures
 import contextlib
 import dataclasses
 from unittest import mock
@@ -42,9 +44,19 @@ import pytest
 from tests.testing.factories import config_factory
 from tests.testing.factories import image_factory
 from tests.testing.factories import instance_factory
+from tests.testing.factories import volume_factory
 from tests.testing.rich import FakeTable
+from yo.api import AttachmentType
+from yo.main import _task_run
+from yo.main import do_detach_volume
+from yo.main import run_all_tasks
+from yo.main import ssh_cmd
+from yo.main import task_get_status
+from yo.main import wait_for_ssh_access
 from yo.main import YoCmd
+from yo.main import YoTask
 from yo.util import strftime
+from yo.util import YoExc
 
 
 @pytest.fixture
@@ -225,3 +237,233 @@ def test_ssh_wait(mock_ctx, mock_ssh, mock_notify, state):
         cmds=[],
         quiet=False,
     )
+
+
+@pytest.mark.parametrize(
+    "cmds,interactive,expected",
+    [
+        ([], None, True),
+        (["uptime"], None, False),
+        ([], False, False),
+        (["console"], True, True),
+    ],
+)
+def test_ssh_interactive_args(mock_ctx, cmds, interactive, expected):
+    mock_ctx.config = config_factory(ssh_interactive_args="-A")
+    cmd = ssh_cmd(mock_ctx, "opc@1.2.3.4", [], cmds, interactive=interactive)
+    assert ("-A" in cmd) == expected
+    assert cmd[-len(cmds) - 1 :] == ["opc@1.2.3.4"] + cmds
+
+
+def test_task_directives():
+    script = (
+        "DEPENDS_ON base\n"
+        "  CONFLICTS_WITH other  \n"
+        "\n"
+        "MAYBE_DEPENDS_ON present\n"
+        "MAYBE_DEPENDS_ON absent\n"
+        "DEPENDS_ON base\n"
+        "echo DEPENDS_ON ignored\n"
+    )
+    tasks = frozenset(["present"])
+    with mock.patch("yo.main._task_name_set", return_value=tasks):
+        task = YoTask.create_from_string("mytask", script)
+    assert task.dependencies == ["base", "present"]
+    assert task.conflicts == ["other"]
+    assert task.script == (
+        "DEPENDS_ON base\n"
+        "  CONFLICTS_WITH other  \n"
+        "\n"
+        "DEPENDS_ON present\n"
+        "# MAYBE_DEPENDS_ON absent\n"
+        "DEPENDS_ON base\n"
+        "echo DEPENDS_ON ignored\n"
+    )
+
+
+def test_task_get_status(mock_ctx, mock_ssh):
+    mock_ssh.ssh_into.return_value.stdout = (
+        b"/home/opc/odd:dir/a/pid:123\n"
+        b"/home/opc/odd:dir/b/status:0\n"
+        b"/home/opc/odd:dir/c/status:1\n"
+        b"/home/opc/odd:dir/d/pid:456\n"
+        b"/home/opc/odd:dir/d/wait:a\n"
+        b"/home/opc/odd:dir/e/pid:789\n"
+        b"/home/opc/odd:dir/e/status:0\n"
+        b"/home/opc/odd:dir/f/wait:a\n"
+    )
+    assert task_get_status(mock_ctx, instance_factory()) == {
+        "a": ("RUNNING", 123),
+        "b": ("SUCCESS", 0),
+        "c": ("FAIL", 0),
+        "d": ("WAITING", "a"),
+        "e": ("UNKNOWN", 0),
+        "f": ("UNKNOWN", 0),
+    }
+
+
+def test_task_get_status_empty(mock_ctx, mock_ssh):
+    mock_ssh.ssh_into.return_value.stdout = b"\n"
+    assert task_get_status(mock_ctx, instance_factory()) == {}
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"/home/opc/.cache/yo-tasks/a/pid",
+        b"/home/opc/.cache/yo-tasks/a/other:1",
+        b"pid:123",
+        b"/pid:123",
+        b"garbage",
+    ],
+)
+def test_task_get_status_malformed(mock_ctx, mock_ssh, line):
+    mock_ssh.ssh_into.return_value.stdout = line + b"\n"
+    with pytest.raises(YoExc, match="bad task status data"):
+        task_get_status(mock_ctx, instance_factory())
+
+
+@pytest.mark.parametrize("batch_bytes,calls", [(64 * 1024, 1), (1, 3)])
+def test_task_run_batches(mock_ctx, mock_ssh, batch_bytes, calls):
+    tasks = [YoTask(n, "", f"echo {n}\n", [], []) for n in ("a", "b", "c")]
+    with mock.patch("yo.main.TASK_RUN_BATCH_BYTES", batch_bytes):
+        _task_run(mock_ctx, instance_factory(), tasks)
+    assert mock_ssh.ssh_into.call_count == calls
+    commands = "\n".join(
+        c[1]["cmds"][0] for c in mock_ssh.ssh_into.call_args_list
+    )
+    positions = [commands.index(f"name={n}\n") for n in ("a", "b", "c")]
+    assert positions == sorted(positions)
+
+
+def _run_tasks(mock_ctx, deps, tasks):
+    library = {n: YoTask(n, "", "", d, []) for n, d in deps.items()}
+    with contextlib.ExitStack() as es:
+        es.enter_context(
+            mock.patch("yo.main.YoTask.load", side_effect=library.__getitem__)
+        )
+        run = es.enter_context(mock.patch("yo.main._task_run"))
+        run_all_tasks(mock_ctx, instance_factory(), tasks)
+    return [task.name for task in run.call_args[0][2]]
+
+
+def test_run_all_tasks_order(mock_ctx):
+    deps = {"app": ["db", "net"], "db": ["net"], "net": []}
+    order = _run_tasks(mock_ctx, deps, ["app"])
+    assert order == ["net", "db", "app"]
+
+
+def test_run_all_tasks_diamond(mock_ctx):
+    deps = {"top": ["left", "right"], "left": ["base"], "right": ["base"]}
+    deps["base"] = []
+    order = _run_tasks(mock_ctx, deps, ["top", "left"])
+    assert sorted(order) == ["base", "left", "right", "top"]
+    assert order[0] == "base"
+    assert order[-1] == "top"
+
+
+def test_run_all_tasks_self_dependency(mock_ctx):
+    with pytest.raises(YoExc, match="circular dependency: loop"):
+        _run_tasks(mock_ctx, {"loop": ["loop"]}, ["loop"])
+
+
+def test_run_all_tasks_circular(mock_ctx):
+    deps = {"a": ["b"], "b": ["c"], "c": ["a"], "d": []}
+    with pytest.raises(YoExc, match="circular dependency: a, b, c$"):
+        _run_tasks(mock_ctx, deps, ["d", "a"])
+
+
+def _attachment(vol, inst):
+    return mock.Mock(volume_id=vol.id, instance_id=inst.id)
+
+
+def test_volume_detach_multiple(mock_ctx):
+    inst, other = instance_factory(), instance_factory()
+    vols = [volume_factory(), volume_factory()]
+    vas = {vol.id: [_attachment(vol, inst)] for vol in vols}
+    vas[vols[1].id].append(_attachment(vols[1], other))
+    mock_ctx.get_volumes.return_value = vols
+    mock_ctx.attached_attachments_by_volume.return_value = vas
+    mock_ctx.get_instance_by_name.return_value = inst
+    names = [vol.name for vol in vols]
+    with mock.patch("yo.main.do_detach_volume") as detach:
+        YoCmd.main("", args=["volume", "detach", "-E", "--from", "x"] + names)
+    mock_ctx.get_volumes.assert_called_once_with(names)
+    assert detach.call_args[0][2] == [vas[v.id][0] for v in vols]
+
+    with mock.patch("yo.main.do_detach_volume") as detach:
+        YoCmd.main("", args=["volume", "detach", "-E", "--all"] + names)
+    assert detach.call_args[0][2] == [va for v in vols for va in vas[v.id]]
+
+    with mock.patch("yo.main.do_detach_volume") as detach:
+        with pytest.raises(YoExc, match="attached to multiple instances"):
+            YoCmd.main("", args=["volume", "detach", "-E"] + names)
+    detach.assert_not_called()
+
+
+def test_volume_delete_multiple(mock_ctx):
+    inst = instance_factory()
+    vols = [volume_factory(), volume_factory()]
+    vas = {vols[0].id: [_attachment(vols[0], inst)], vols[1].id: []}
+    mock_ctx.get_volumes.return_value = vols
+    mock_ctx.attached_attachments_by_volume.return_value = vas
+    names = [vols[0].name, vols[1].name, vols[0].name]
+    with mock.patch("yo.main.do_detach_volume") as detach:
+        YoCmd.main("", args=["volume", "delete", "-E"] + names)
+    mock_ctx.get_volumes.assert_called_once_with(names)
+    assert detach.call_args[0][2] == vas[vols[0].id]
+    assert mock_ctx.delete_volume.call_args_list == [
+        mock.call(vols[0]),
+        mock.call(vols[1]),
+    ]
+
+
+def test_do_detach_volume_unmounts_per_instance(mock_ctx, mock_ssh):
+    insts = {inst.id: inst for inst in (instance_factory(), instance_factory())}
+    ips = {inst.id: f"10.0.0.{i}" for i, inst in enumerate(insts.values())}
+    vas = [
+        mock.Mock(instance_id=inst_id, attachment_type=AttachmentType.ISCSI)
+        for inst_id in insts
+        for _ in range(2)
+    ]
+    events = []
+
+    def ssh_into(ip, *args, **kwargs):
+        events.append(("unmount", ip))
+        return mock.Mock(returncode=0)
+
+    mock_ssh.ssh_into.side_effect = ssh_into
+    mock_ctx.get_instance_by_id.side_effect = insts.__getitem__
+    mock_ctx.get_instance_ip.side_effect = lambda inst: ips[inst.id]
+    mock_ctx.get_attachment_commands.return_value = ([], ["umount"])
+    mock_ctx.detach_volume.side_effect = lambda va: events.append(
+        ("detach", va)
+    )
+    with concurrent.futures.ThreadPoolExecutor() as tpe:
+        mock_ctx._tpe = tpe
+        do_detach_volume(mock_ctx, argparse.Namespace(teardown=True), vas)
+
+    assert sorted(e[1] for e in events if e[0] == "unmount") == sorted(
+        ips.values()
+    )
+    assert [e[1] for e in events if e[0] == "detach"] == vas
+    for va in vas:
+        unmount = events.index(("unmount", ips[va.instance_id]))
+        assert unmount < events.index(("detach", va))
+    mock_ctx.wait_attachments.assert_called_once_with(vas, "DETACHED")
+
+
+@pytest.mark.parametrize("probe", [True, False])
+def test_wait_for_ssh_access_probe(mock_ctx, probe):
+    mock_ctx.config = config_factory(ssh_port_probe=probe)
+    with contextlib.ExitStack() as es:
+        ready = es.enter_context(
+            mock.patch("yo.main.ssh_port_ready", return_value=True)
+        )
+        run = es.enter_context(mock.patch("yo.main.subprocess.run"))
+        run.return_value.returncode = 0
+        progress = es.enter_context(mock.patch("yo.main.Progress"))
+        progress.return_value.finished = False
+        assert wait_for_ssh_access("1.2.3.4", "opc", mock_ctx)
+    assert ready.called == probe
+    run.assert_called_once()
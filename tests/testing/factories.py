@@ -40,8 +40,10 @@ from types import SimpleNamespace
 
 from yo.api import now
 from yo.api import TERMPROTECT
+from yo.api import VolumeKind
 from yo.api import YoImage
 from yo.api import YoInstance
+from yo.api import YoVolume
 from yo.util import YoConfig
 from yo.util import YoRegion
 
@@ -126,6 +128,26 @@ def image_factory(**kwargs) -> YoImage:
     return YoImage(**defaults)  # type: ignore
 
 
+def volume_factory(**kwargs) -> YoVolume:
+    name = kwargs.pop("name", _unique_name())
+    defaults = {
+        "name": name,
+        "id": _random_id(),
+        "ad": AVAILABILITY_DOMAIN,
+        "state": "AVAILABLE",
+        "kind": VolumeKind.BLOCK,
+        "image_id": None,
+        "compartment_id": _random_id(),
+        "size_in_gbs": 50,
+        "time_created": now() - datetime.timedelta(seconds=60),
+        "created_by": MY_EMAIL,
+        "alt_name": name,
+        "freeform_tags": {},
+    }
+    defaults.update(kwargs)
+    return YoVolume(**defaults)  # type: ignore
+
+
 def config_factory(**kwargs) -> YoConfig:
     defaults = {
         "instance_compartment_id": _random_id(),
@@ -174,6 +196,25 @@ def oci_instance_factory(**kwargs) -> t.Any:
     return SimpleNamespace(**defaults)
 
 
+def oci_volume_attachment_factory(**kwargs) -> t.Any:
+    defaults = {
+        "id": _random_id(),
+        "display_name": "attachment",
+        "availability_domain": AVAILABILITY_DOMAIN,
+        "lifecycle_state": "ATTACHED",
+        "compartment_id": _random_id(),
+        "volume_id": _random_id(),
+        "instance_id": _random_id(),
+        "time_created": now() - datetime.timedelta(seconds=60),
+        "attachment_type": "paravirtualized",
+        "is_shareable": False,
+        "is_read_only": False,
+        "device": None,
+    }
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
 def oci_instance_fromyo(i: YoInstance) -> t.Any:
     return oci_instance_factory(
         id=i.id,
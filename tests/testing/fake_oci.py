@@ -43,6 +43,7 @@ from oci.core.models import Instance
 from oci.core.models import VnicAttachment
 
 from tests.testing.factories import FakeResponse
+from yo.oci import WaitItem
 
 
 class FakeOCICompute:
@@ -61,6 +62,7 @@ class FakeOCICompute:
     def __init__(self):
         self._instances: t.List[Instance] = []
         self._vnic_attachments: t.List[VnicAttachment] = []
+        self._volume_attachments: t.List[t.Any] = []
 
         # Create mocks for each f_ method.
         for key in dir(self):
@@ -94,9 +96,16 @@ class FakeOCICompute:
         assert False, "Instance ID not present in fake OCI"
 
     def f_list_instances(
-        self, compartment_id: str, limit: int = 1000
+        self,
+        compartment_id: str,
+        limit: int = 1000,
+        display_name: t.Optional[str] = None,
     ) -> FakeResponse:
-        return FakeResponse(self._instances)
+        if display_name is None:
+            return FakeResponse(self._instances)
+        return FakeResponse(
+            [i for i in self._instances if i.display_name == display_name]
+        )
 
     def f_terminate_instance(
         self, inst_id: str, **kwargs: t.Any
@@ -117,6 +126,19 @@ class FakeOCICompute:
     def f_update_instance(self, inst_id: str, details: t.Any) -> FakeResponse:
         return FakeResponse(self._get_instance(inst_id))
 
+    def _get_volume_attachment(self, va_id: str) -> t.Any:
+        for va in self._volume_attachments:
+            if va.id == va_id:
+                return va
+        assert False, "Volume attachment ID not present in fake OCI"
+
+    def f_get_volume_attachment(self, va_id: str) -> FakeResponse:
+        return FakeResponse(self._get_volume_attachment(va_id))
+
+    def f_detach_volume(self, va_id: str) -> FakeResponse:
+        self._get_volume_attachment(va_id).lifecycle_state = "DETACHING"
+        return FakeResponse(None)
+
 
 class FakeOCI:
     def __init__(self, ctx):
@@ -131,6 +153,12 @@ class FakeOCI:
         ctx._oci.list_call_get_all_results_generator.side_effect = (
             self.list_call_get_all_results_generator
         )
+        # Waits complete immediately, with the item in the desired state
+        ctx._oci.WaitItem = WaitItem
+        ctx._oci.wait_until_progress.side_effect = self.wait_until_progress
+        ctx._oci.wait_until_progress_many.side_effect = (
+            self.wait_until_progress_many
+        )
         ctx._vnet = mock.Mock()
         ctx._compute = self.compute
 
@@ -140,3 +168,13 @@ class FakeOCI:
 
     def list_call_get_all_results(self, fn, *args, **kwargs):
         return fn(*args, **kwargs)
+
+    def wait_until_progress(self, ctx, client, item, attr, state, **kwargs):
+        setattr(item.data, attr, state)
+        return item
+
+    def wait_until_progress_many(self, ctx, items, *args, **kwargs):
+        return [
+            self.wait_until_progress(ctx, wi.client, wi.item, wi.attr, wi.state)
+            for wi in items
+        ]
@@ -48,6 +48,7 @@ import os
 import random
 import re
 import stat
+import threading
 import time
 import typing as t
 from collections import defaultdict
@@ -1034,6 +1035,9 @@ class YoCtx:
     _limits: t.Optional["LimitsClient"] = None
 
     _tpe: concurrent.futures.ThreadPoolExecutor
+    # Serializes writers of the cache file within this process, since we may
+    # load resources (and save the cache) from several threads at once.
+    _save_lock = threading.Lock()
     _oci_config: t.Dict[str, t.Any]
 
     def _setup_oci(self) -> None:
@@ -1182,29 +1186,31 @@ class YoCtx:
         # our PID. Once the contents are completely written, we can use rename()
         # which will atomically replace the cache. The concurrent reader will
         # see the old or new, but never a partial cache.
-        cache_pid_file = f"{self._cache_file}.{os.getpid()}"
-        cache_dir = os.path.dirname(cache_pid_file)
-        cache: t.Dict[str, t.Any] = {
-            "cache_version": self.cache_version,
-            "resource_filtering": self.config.resource_filtering,
-            "last_checked_for_update": toisoformat(
-                self.last_checked_for_update
-            ),
-        }
-        for cache_attr in self._caches:
-            yc: YoCache[t.Any] = getattr(self, cache_attr)
-            cache[yc.name] = yc.export()
-        os.makedirs(cache_dir, exist_ok=True)
-        with open(cache_pid_file, "w") as f:
-            # It seems best to reduce the permission on this file, so it can
-            # only be read or written by the current user (600 permissions).
-            # However Windows doesn't support fchmod(), and its chmod()
-            # implementation would only let us set the read-only flag. So we'll
-            # just skip that if fchmod() unavailable.
-            if hasattr(os, "fchmod"):
-                os.fchmod(f.fileno(), stat.S_IRUSR | stat.S_IWUSR)
-            json.dump(cache, f, indent=4)
-        os.replace(cache_pid_file, self._cache_file)
+        with self._save_lock:
+            cache_pid_file = f"{self._cache_file}.{os.getpid()}"
+            cache_dir = os.path.dirname(cache_pid_file)
+            cache: t.Dict[str, t.Any] = {
+                "cache_version": self.cache_version,
+                "resource_filtering": self.config.resource_filtering,
+                "last_checked_for_update": toisoformat(
+                    self.last_checked_for_update
+                ),
+            }
+            for cache_attr in self._caches:
+                yc: YoCache[t.Any] = getattr(self, cache_attr)
+                cache[yc.name] = yc.export()
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_pid_file, "w") as f:
+                # It seems best to reduce the permission on this file, so it
+                # can only be read or written by the current user (600
+                # permissions). However Windows doesn't support fchmod(), and
+                # its chmod() implementation would only let us set the
+                # read-only flag. So we'll just skip that if fchmod()
+                # unavailable.
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), stat.S_IRUSR | stat.S_IWUSR)
+                json.dump(cache, f, indent=4)
+            os.replace(cache_pid_file, self._cache_file)
 
     def clear_cache(self) -> None:
         for cache_attr in self._caches:
@@ -1361,6 +1367,31 @@ class YoCtx:
                 matches.append(inst)
         return matches
 
+    def instance_exists(
+        self, name: str, exclude_terminated: bool = True
+    ) -> bool:
+        """
+        Return True if one of our instances has exactly this name. The cache
+        could miss an instance created elsewhere, so ask the API. But rather
+        than listing (and caching) every instance, only request the instances
+        with this display name.
+        """
+        instances = self.oci.list_call_get_all_results(
+            self.compute.list_instances,
+            self.config.instance_compartment_id,
+            display_name=name,
+        ).data
+        for instance in instances:
+            if exclude_terminated and instance.lifecycle_state == "TERMINATED":
+                continue
+            tags = instance.defined_tags.get("Oracle-Tags", {})
+            email = tags.get("CreatedBy")
+            if not email:
+                email = instance.freeform_tags.get(CREATEDBY)
+            if self.filter_by_creator(email):
+                return True
+        return False
+
     def _filter_instances(
         self,
         instances: t.List[YoInstance],
@@ -1651,15 +1682,23 @@ class YoCtx:
             self.save_cache()
         return res
 
-    def list_all_images(self, refresh: bool = False) -> t.List[YoImage]:
+    def list_all_images(
+        self,
+        refresh: bool = False,
+        stale_thresh: t.Optional[datetime.timedelta] = None,
+    ) -> t.List[YoImage]:
         """
         List all OCI images, including custom images.
+
+        :param refresh: force a refresh of the image cache
+        :param stale_thresh: if provided, accept cached data up to this age,
+          rather than using the default staleness threshold for images
         """
         compartments = [
             self.config.instance_compartment_id
         ] + self.config.image_compartment_ids
         images = []
-        if refresh or not self._images.is_current():
+        if refresh or not self._images.is_current(stale_thresh):
             self.con.log("Refreshing cached image list")
             seen_ids = set()
             for cid in compartments:
@@ -1678,12 +1717,15 @@ class YoCtx:
             self.save_cache()
         return self._images.get_all()
 
-    def list_official_images(self) -> t.List[YoImage]:
+    def list_official_images(
+        self,
+        stale_thresh: t.Optional[datetime.timedelta] = None,
+    ) -> t.List[YoImage]:
         """
         List all *official* images
         """
         images = []
-        for img in self.list_all_images():
+        for img in self.list_all_images(stale_thresh=stale_thresh):
             if img.created_by:
                 continue
             images.append(img)
@@ -2353,19 +2395,34 @@ class YoCtx:
     def get_volume(
         self, name: str, kind: t.Optional[VolumeKind] = None
     ) -> YoVolume:
-        matches = []
+        return self.get_volumes([name], kind)[0]
+
+    def get_volumes(
+        self, names: t.Iterable[str], kind: t.Optional[VolumeKind] = None
+    ) -> t.List[YoVolume]:
+        """
+        Lookup several volumes by name, in a single pass over the volume list.
+        As with get_volume(), each name must match exactly one volume. Each
+        volume is returned once, in the order it was first named.
+        """
+        matches: t.Dict[str, t.List[YoVolume]] = {name: [] for name in names}
         for vol in self.list_volumes():
-            if (
-                vol.name == name or vol.alt_name == name
-            ) and vol.state != "TERMINATED":
-                if not kind or vol.kind == kind:
-                    matches.append(vol)
+            if vol.state == "TERMINATED" or (kind and vol.kind != kind):
+                continue
+            for vol_name in {vol.name, vol.alt_name}:
+                if vol_name in matches:
+                    matches[vol_name].append(vol)
         typ = f" {kind.name}" if kind else ""
-        return one(
-            matches,
-            f"no{typ} volume with name {name}",
-            f"multiple{typ} volumes with name {name}",
-        )
+        # A volume may be named twice, possibly by both of its names
+        vols: t.Dict[str, YoVolume] = {}
+        for name, vol_matches in matches.items():
+            vol = one(
+                vol_matches,
+                f"no{typ} volume with name {name}",
+                f"multiple{typ} volumes with name {name}",
+            )
+            vols.setdefault(vol.id, vol)
+        return list(vols.values())
 
     def attachments_by_volume(self) -> t.Dict[str, t.List[YoVolumeAttachment]]:
         ret: t.Dict[str, t.List[YoVolumeAttachment]] = defaultdict(list)
@@ -2373,6 +2430,19 @@ class YoCtx:
             ret[va.volume_id].append(va)
         return ret
 
+    def attached_attachments_by_volume(
+        self,
+    ) -> t.Dict[str, t.List[YoVolumeAttachment]]:
+        """
+        Like attachments_by_volume(), but only include attachments which are
+        currently in the ATTACHED state.
+        """
+        ret: t.Dict[str, t.List[YoVolumeAttachment]] = defaultdict(list)
+        for va in self.list_volume_attachments():
+            if va.state == "ATTACHED":
+                ret[va.volume_id].append(va)
+        return ret
+
     def attachments_by_instance(
         self,
     ) -> t.Dict[str, t.List[YoVolumeAttachment]]:
@@ -2510,35 +2580,66 @@ class YoCtx:
         self.save_cache()
         return new_vol
 
-    def wait_attachment(
-        self, va: YoVolumeAttachment, state: str
+    def _get_oci_attachment(self, va: YoVolumeAttachment) -> t.Any:
+        if va.kind == VolumeKind.BLOCK:
+            return self.compute.get_volume_attachment(va.id)
+        else:
+            return self.compute.get_boot_volume_attachment(va.id)
+
+    @staticmethod
+    def _attachment_from_oci(
+        va: YoVolumeAttachment, oci_va: t.Any
     ) -> YoVolumeAttachment:
         if va.kind == VolumeKind.BLOCK:
-            oci_va = self.compute.get_volume_attachment(va.id)
-            oci_new_va = self.oci.wait_until_progress(
-                self,
-                self.compute,
-                oci_va,
-                "lifecycle_state",
-                state,
-                display_name="attachment",
-            ).data
-            new_va = YoVolumeAttachment.from_oci_block(oci_new_va)
+            return YoVolumeAttachment.from_oci_block(oci_va)
         else:
-            oci_bva = self.compute.get_boot_volume_attachment(va.id)
-            oci_new_bva = self.oci.wait_until_progress(
-                self,
-                self.compute,
-                oci_bva,
-                "lifecycle_state",
-                state,
-                display_name="attachment",
-            ).data
-            new_va = YoVolumeAttachment.from_oci_boot(oci_new_bva)
+            return YoVolumeAttachment.from_oci_boot(oci_va)
+
+    def wait_attachment(
+        self, va: YoVolumeAttachment, state: str
+    ) -> YoVolumeAttachment:
+        oci_new_va = self.oci.wait_until_progress(
+            self,
+            self.compute,
+            self._get_oci_attachment(va),
+            "lifecycle_state",
+            state,
+            display_name="attachment",
+        ).data
+        new_va = self._attachment_from_oci(va, oci_new_va)
         self._vas.insert(new_va)
         self.save_cache()
         return new_va
 
+    def wait_attachments(
+        self, vas: t.List[YoVolumeAttachment], state: str
+    ) -> t.List[YoVolumeAttachment]:
+        """
+        Wait for several volume attachments to reach a state concurrently
+        """
+        oci_vas = list(self._tpe.map(self._get_oci_attachment, vas))
+        resps = self.oci.wait_until_progress_many(
+            self,
+            [
+                self.oci.WaitItem(
+                    self.compute,
+                    oci_va,
+                    "lifecycle_state",
+                    state,
+                    display_name=f"attachment {va.name}",
+                )
+                for va, oci_va in zip(vas, oci_vas)
+            ],
+            self._tpe,
+        )
+        new_vas = []
+        for va, resp in zip(vas, resps):
+            new_va = self._attachment_from_oci(va, resp.data)
+            self._vas.insert(new_va)
+            new_vas.append(new_va)
+        self.save_cache()
+        return new_vas
+
     def get_attachment_commands(
         self, va: YoVolumeAttachment
     ) -> t.Tuple[t.List[str], t.List[str]]:
@@ -70,16 +70,19 @@ set "exact_name = true" in the [yo] section of your config.
 """
 import argparse
 import collections
+import concurrent.futures
 import contextlib
 import dataclasses
+import datetime
+import functools
+import hashlib
 import importlib
 import inspect
 import os
-import random
 import re
 import runpy
 import shlex
-import string
+import socket
 import subprocess
 import sys
 import textwrap
@@ -93,7 +96,6 @@ from functools import lru_cache
 import argcomplete  # type: ignore
 import rich.console
 import rich.progress
-import rich.syntax
 import rich.table
 import subc
 from oci.exceptions import ServiceError
@@ -162,6 +164,17 @@ SSH_OPTIONS = [
     "-oServerAliveInterval=60",
     "-oTCPKeepAlive=yes",
 ]
+SSH_CONTROL_DIR = os.path.expanduser("~/.cache/yo")
+# Yo tends to run several short-lived SSH commands against the same instance
+# (waiting for SSH, running tasks, checking their status). Multiplexing them
+# over one connection saves a full key exchange and authentication each time.
+# These are added after the user's ssh_args, and since SSH uses the first value
+# it finds for an option, users may override them (e.g. -oControlMaster=no).
+SSH_MULTIPLEX_OPTIONS = [
+    "-oControlMaster=auto",
+    f"-oControlPath={SSH_CONTROL_DIR}/cm-%C",
+    "-oControlPersist=60s",
+]
 SSH_CONSOLE_OPTIONS = [
     "-oHostKeyAlgorithms=+ssh-rsa",
     # From the OpenSSH 8.5 Changelog:
@@ -178,6 +191,20 @@ SSH_CONSOLE_OPTIONS = [
     "-oPubkeyAcceptedKeyTypes=+ssh-rsa",
 ]
 SSH_MINIMUM_TIME = 4
+# With ssh_port_probe, we probe the port directly while waiting for SSH, rather
+# than spawning an ssh client each time. A real connection is still attempted at
+# this interval (in seconds), in case the probe doesn't reflect how SSH reaches
+# the instance.
+SSH_PROBE_FALLBACK_SEC = 30
+
+# The files which task_get_status() reads from each task's directory
+TASK_STATUS_KINDS = ("pid", "status", "wait")
+# Upper bound on the size of one SSH command launching tasks (_task_run). Linux
+# limits a single argument to 128KiB (MAX_ARG_STRLEN).
+TASK_RUN_BATCH_BYTES = 64 * 1024
+# Polling interval bounds while waiting for tasks (task_join)
+TASK_POLL_MIN_SEC = 1
+TASK_POLL_MAX_SEC = 5
 
 REPOSITORY_URL = "https://github.com/oracle/yo"
 DOCUMENTATION_URL = "https://oracle.github.io/yo/"
@@ -186,6 +213,8 @@ INITIAL_CONFIG_LINK = REPOSITORY_URL
 warned_about_SSH_timeout = False
 
 PYVER = sys.version_info[:2]
+# Python 3.6 has no capture_output= kwarg for subprocess.run()
+NEED_CAPTURE_OUTPUT_SHIM = PYVER == (3, 6)
 
 COMMAND_GROUP_ORDER = [
     "Basic Commands",
@@ -213,6 +242,60 @@ class ParagraphFormatter(argparse.HelpFormatter):
         return "\n\n".join(wrapped_pars)
 
 
+class LazyArgumentParser(argparse.ArgumentParser):
+    """
+    An argument parser which can add its arguments on first use
+
+    Yo has many sub-commands, but each invocation only runs one of them. When
+    sub-command parsers are created with this class, each command's add_args()
+    is deferred (see YoCmd.__init_subclass__) until its parser is actually used
+    to parse arguments or format help. So only the selected command pays the
+    cost of setting up its arguments.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending_args: t.List[t.Callable[[], None]] = []
+        self.loading_args = False
+
+    def load_pending_args(self) -> None:
+        self.loading_args = True
+        try:
+            while self.pending_args:
+                self.pending_args.pop(0)()
+        finally:
+            self.loading_args = False
+
+    # Newer typeshed versions declare overloads for this method, which the
+    # pass-through signature can't match. Older ones don't need the ignore.
+    def parse_known_args(  # type: ignore[override, unused-ignore]
+        self, *args: t.Any, **kwargs: t.Any
+    ) -> t.Tuple[argparse.Namespace, t.List[str]]:
+        self.load_pending_args()
+        return super().parse_known_args(*args, **kwargs)
+
+    def format_usage(self) -> str:
+        self.load_pending_args()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self.load_pending_args()
+        return super().format_help()
+
+
+def _defer_add_args(
+    add_args: t.Callable[[t.Any, argparse.ArgumentParser], None]
+) -> t.Callable[[t.Any, argparse.ArgumentParser], None]:
+    @functools.wraps(add_args)
+    def wrapper(self: t.Any, parser: argparse.ArgumentParser) -> None:
+        if isinstance(parser, LazyArgumentParser) and not parser.loading_args:
+            parser.pending_args.append(lambda: add_args(self, parser))
+        else:
+            add_args(self, parser)
+
+    return wrapper
+
+
 def arg_choices(c: t.List[str]) -> t.Optional[t.List[str]]:
     if os.environ.get("SPHINX_BUILD") == "1":
         return None
@@ -351,12 +434,14 @@ def load_config(config_file: str = CONFIG_FILE) -> FullYoConfig:
     return FullYoConfig(yo_config, instance_profiles, aliases)
 
 
-def ssh_args(
-    ctx: YoCtx,
-    interactive: bool,
-) -> t.List[str]:
+@lru_cache(maxsize=None)
+def _ssh_args(
+    config_args: t.Optional[str],
+    private_key: t.Optional[str],
+    interactive_args: t.Optional[str],
+) -> t.Tuple[str, ...]:
     cmd = SSH_OPTIONS.copy()
-    cmd += shlex.split(ctx.config.ssh_args or "")
+    cmd += shlex.split(config_args or "")
     if "-i" in cmd:
         raise YoExc(
             "you have -i configured in ssh_args, but yo now "
@@ -364,11 +449,31 @@ def ssh_args(
             "your configured SSH key. Please remove it from your"
             "configuration."
         )
-    if ctx.config.ssh_private_key is not None:
-        cmd.extend(["-i", str(ctx.config.ssh_private_key)])
-    if interactive:
-        cmd += shlex.split(ctx.config.ssh_interactive_args or "")
-    return cmd
+    if private_key is not None:
+        cmd.extend(["-i", private_key])
+    if interactive_args is not None:
+        cmd += shlex.split(interactive_args)
+    if sys.platform != "win32":
+        # Windows OpenSSH does not support connection multiplexing
+        os.makedirs(SSH_CONTROL_DIR, exist_ok=True)
+        cmd += SSH_MULTIPLEX_OPTIONS
+    return tuple(cmd)
+
+
+def ssh_args(
+    ctx: YoCtx,
+    interactive: bool,
+) -> t.List[str]:
+    # The arguments only depend on these configuration values, so cache the
+    # parsed result by value. SSH commands are built repeatedly while polling.
+    private_key = ctx.config.ssh_private_key
+    return list(
+        _ssh_args(
+            ctx.config.ssh_args,
+            str(private_key) if private_key is not None else None,
+            (ctx.config.ssh_interactive_args or "") if interactive else None,
+        )
+    )
 
 
 def ssh_cmd(
@@ -376,9 +481,17 @@ def ssh_cmd(
     target: str,
     extra_args: t.Iterable[str] = (),
     cmds: t.Iterable[str] = (),
+    interactive: t.Optional[bool] = None,
 ) -> t.List[str]:
-    cmds = list(cmds)
-    cmd = ["ssh"] + ssh_args(ctx, bool(cmds))
+    """
+    Build an SSH command line. Unless specified, the session is assumed to be
+    interactive when there are no commands to run.
+    """
+    if not isinstance(cmds, (list, tuple)):
+        cmds = list(cmds)
+    if interactive is None:
+        interactive = not cmds
+    cmd = ["ssh"] + ssh_args(ctx, interactive)
     cmd.extend(extra_args)
     cmd.append(target)
     cmd.extend(cmds)
@@ -412,9 +525,8 @@ def ssh_into(
     # Python 3.6 has no capture_output= kwarg. But we can just implement it
     # here. The run() method *will* properly handle reading from the pipe,
     # so we don't risk a deadlock.
-    capture_output = kwargs.get("capture_output")
-    if capture_output is not None and PYVER == (3, 6):
-        del kwargs["capture_output"]
+    if NEED_CAPTURE_OUTPUT_SHIM and "capture_output" in kwargs:
+        capture_output = kwargs.pop("capture_output")
         if capture_output:
             kwargs["stdout"] = subprocess.PIPE
             kwargs["stderr"] = subprocess.STDOUT
@@ -422,6 +534,19 @@ def ssh_into(
     return subprocess.run(cmd, **kwargs)
 
 
+def ssh_port_ready(ip: str, timeout: float = 2) -> bool:
+    """
+    Return True if an SSH server banner can be read from port 22 of ip. This is
+    far cheaper than running the ssh client, and it lets us avoid spawning ssh
+    until the server is at least accepting connections.
+    """
+    try:
+        with socket.create_connection((ip, 22), timeout=timeout) as sock:
+            return sock.recv(16).startswith(b"SSH-")
+    except OSError:
+        return False
+
+
 def wait_for_ssh_access(
     ip: str,
     user: str,
@@ -430,7 +555,12 @@ def wait_for_ssh_access(
     ssh_warn_grace: int = 60,
 ) -> bool:
     global warned_about_SSH_timeout
-    start_time = last_time = time.time()
+    start_time = time.monotonic()
+    last_ssh_time = start_time - SSH_PROBE_FALLBACK_SEC
+    # SSH arguments (in the config or ~/.ssh/config) may change the port, or
+    # use a proxy or jump host, in which case a direct probe of port 22 is
+    # meaningless. So the probe is opt-in.
+    use_probe = ctx.config.ssh_port_probe
     progress = Progress(
         rich.progress.TextColumn("{task.description}"),
         rich.progress.SpinnerColumn(),
@@ -444,29 +574,41 @@ def wait_for_ssh_access(
             "Wait for SSH", total=timeout_sec, finished_time=1, start=True
         )
         while not progress.finished:
-            cmd = ssh_cmd(ctx, f"{user}@{ip}", ["-q"], ["true"])
-            proc = subprocess.Popen(cmd)
             rv = 1
-            try:
-                rv = proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                proc.terminate()
-                proc.wait()
-                if (
-                    not warned_about_SSH_timeout
-                    and time.time() - start_time >= ssh_warn_grace
-                ):
-                    ctx.con.log(
-                        "[magenta]Warning:[/magenta] SSH command timed out. "
-                        "This is normal: it may happen early in the boot. "
-                        "But, it can also happen if you're disconnected from "
-                        "a VPN between you and your instance. Double check your "
-                        "connection if this hangs for more than a few minutes."
-                    )
-                    warned_about_SSH_timeout = True
-            new_time = time.time()
-            progress.advance(t, new_time - last_time)
-            last_time = new_time
+            if (
+                not use_probe
+                or ssh_port_ready(ip)
+                or time.monotonic() - last_ssh_time >= SSH_PROBE_FALLBACK_SEC
+            ):
+                last_ssh_time = time.monotonic()
+                cmd = ssh_cmd(
+                    ctx, f"{user}@{ip}", ["-q"], ["true"], interactive=False
+                )
+                try:
+                    rv = subprocess.run(
+                        cmd,
+                        timeout=5,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    ).returncode
+                except subprocess.TimeoutExpired:
+                    if (
+                        not warned_about_SSH_timeout
+                        and time.monotonic() - start_time >= ssh_warn_grace
+                    ):
+                        ctx.con.log(
+                            "[magenta]Warning:[/magenta] SSH command timed out. "
+                            "This is normal: it may happen early in the boot. "
+                            "But, it can also happen if you're disconnected "
+                            "from a VPN between you and your instance. Double "
+                            "check your connection if this hangs for more than "
+                            "a few minutes."
+                        )
+                        warned_about_SSH_timeout = True
+            else:
+                time.sleep(1)
+            progress.update(t, completed=time.monotonic() - start_time)
             if rv == 0:
                 ctx.con.log("SSH is up!")
                 return True
@@ -481,31 +623,41 @@ class YoTask:
     dependencies: t.List[str]
     conflicts: t.List[str]
 
+    # Matches a whole directive line: (keyword, argument)
+    DIRECTIVE_RE = re.compile(
+        r"^[ \t]*(DEPENDS_ON|CONFLICTS_WITH|MAYBE_DEPENDS_ON)[ \t]+(.*?)[ \t]*$",
+        re.MULTILINE,
+    )
+
     @classmethod
     def create_from_string(cls, name: str, script: str) -> "YoTask":
         dependencies = []
         conflicts = []
-        all_tasks = list_tasks()
-        lines = script.split("\n")
-        for i in range(len(lines)):
-            line = lines[i].strip()
-            if line.startswith("DEPENDS_ON"):
-                dependencies.append(line.split(None, maxsplit=1)[1])
-            elif line.startswith("CONFLICTS_WITH"):
-                conflicts.append(line.split(None, maxsplit=1)[1])
-            elif line.startswith("MAYBE_DEPENDS_ON"):
-                task = line.split(None, maxsplit=1)[1]
-                if task in all_tasks:
-                    dependencies.append(task)
-                    line = line.replace("MAYBE_DEPENDS_ON", "DEPENDS_ON")
-                else:
-                    line = line.replace(
-                        "MAYBE_DEPENDS_ON", "# MAYBE_DEPENDS_ON"
-                    )
-                lines[i] = line
-        return YoTask(
-            name, "(memory)", "\n".join(lines), dependencies, conflicts
-        )
+        all_tasks = _task_name_set()
+
+        def add_dependency(dep: str) -> None:
+            # A task may name the same dependency more than once (e.g. both
+            # DEPENDS_ON and MAYBE_DEPENDS_ON): only record it once.
+            if dep not in dependencies:
+                dependencies.append(dep)
+
+        def handle(match: t.Match[str]) -> str:
+            kind, arg = match.groups()
+            if kind == "DEPENDS_ON":
+                add_dependency(arg)
+            elif kind == "CONFLICTS_WITH":
+                conflicts.append(arg)
+            elif arg in all_tasks:
+                add_dependency(arg)
+                return f"DEPENDS_ON {arg}"
+            else:
+                return f"# MAYBE_DEPENDS_ON {arg}"
+            return match.group(0)
+
+        # A single scan over the script finds every directive, rather than
+        # checking each line of the script in Python.
+        script = cls.DIRECTIVE_RE.sub(handle, script)
+        return YoTask(name, "(memory)", script, dependencies, conflicts)
 
     @classmethod
     @lru_cache(maxsize=None)
@@ -516,12 +668,8 @@ class YoTask:
         This function is cached - it will only really search and load any given
         task name once: then it will return the same object thereafter.
         """
-        for directory in TASK_DIRECTORIES:
-            path = os.path.join(directory, name)
-            if os.path.isfile(path):
-                path = os.path.abspath(path)
-                break
-        else:
+        path = _scan_tasks().paths.get(name)
+        if not path:
             raise YoExc(f"error: Script for task {name} not found")
 
         with open(path) as f:
@@ -529,44 +677,91 @@ class YoTask:
         return cls.create_from_string(name, script)
 
 
-@lru_cache(maxsize=1)
-def list_tasks() -> t.List[str]:
-    tasks = []
+class _TaskIndex(t.NamedTuple):
+    mtimes: t.Tuple[t.Optional[int], ...]
+    names: t.List[str]
+    name_set: t.FrozenSet[str]
+    paths: t.Dict[str, str]
+
+
+_task_index: t.Optional[_TaskIndex] = None
+
+
+def _scan_tasks() -> _TaskIndex:
+    """
+    Return the available tasks, rescanning only if a task directory changed
+    """
+    global _task_index
+    mtimes: t.List[t.Optional[int]] = []
     for directory in TASK_DIRECTORIES:
-        if os.path.isdir(directory):
-            tasks.extend(os.listdir(directory))
-    return sorted({s for s in tasks if s[-1] != "~"})
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    if _task_index and _task_index.mtimes == tuple(mtimes):
+        return _task_index
+    paths: t.Dict[str, str] = {}
+    for directory in TASK_DIRECTORIES:
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Skip editor backups, and anything that isn't a script. The
+                # DirEntry usually knows its type without another stat().
+                # Earlier directories take precedence.
+                if (
+                    entry.name[-1] != "~"
+                    and entry.name not in paths
+                    and entry.is_file()
+                ):
+                    paths[entry.name] = os.path.abspath(entry.path)
+    names = sorted(paths)
+    _task_index = _TaskIndex(tuple(mtimes), names, frozenset(names), paths)
+    return _task_index
+
+
+def list_tasks() -> t.List[str]:
+    return _scan_tasks().names
+
+
+def _task_name_set() -> t.FrozenSet[str]:
+    # For membership tests: list_tasks() is sorted for display
+    return _scan_tasks().name_set
 
 
 def get_safe_heredoc(text: str) -> str:
-    while True:
-        here = "".join(random.sample(string.ascii_letters, 32))
-        if here not in text:
-            return here
+    # Derive the delimiter from the text itself, so that the same script
+    # always gets the same delimiter. A collision is practically impossible,
+    # but checking is cheap and guarantees the heredoc can't end early.
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    here = f"YO_EOF_{digest}"
+    count = 0
+    while here in text:
+        count += 1
+        here = f"YO_EOF_{digest}_{count}"
+    return here
 
 
 @lru_cache(maxsize=1)
-def get_tasklib(task_dir_safe: str) -> str:
+def _tasklib_parts() -> t.Tuple[str, str]:
     tasklib = os.path.join(
         os.path.abspath(os.path.dirname(__file__)), "data/yo_tasklib.sh"
     )
-    contents = open(tasklib).read()
-    return contents.replace("$$TASK_DIR$$", task_dir_safe)
+    with open(tasklib) as f:
+        left, right = f.read().split("$$TASK_DIR$$", 1)
+    return left, right
 
 
-def _task_run(ctx: YoCtx, inst: YoInstance, task: YoTask) -> None:
-    """
-    Run a task on an instance. This doesn't check or load dependencies.
+def get_tasklib(task_dir_safe: str) -> str:
+    left, right = _tasklib_parts()
+    return left + task_dir_safe + right
+
+
+# The shell commands used by _task_run() to start a task in the background
+TASK_RUN_TEMPLATE = inspect.cleandoc(
     """
-    task_dir_safe = ctx.config.task_dir_safe
-    ctx.con.log(
-        f"Start task [blue]{task.name}[/blue] on instance [green]{inst.name}..."
-    )
-    ip = ctx.get_instance_ip(inst, True)
-    user = ctx.get_ssh_user(inst)
-    script_text = get_tasklib(task_dir_safe) + task.script
-    commands = inspect.cleandoc(
-        """
     task_dir={task_dir}
     name={name}
     dir="$task_dir/$name"
@@ -589,15 +784,52 @@ def _task_run(ctx: YoCtx, inst: YoInstance, task: YoTask) -> None:
         >./output 2>&1 </dev/null &
     echo $! >./pid
     """
-    )
-    heredoc = get_safe_heredoc(script_text)
-    commands = commands.format(
-        heredoc=heredoc,
-        script_text=script_text,
-        task_dir=task_dir_safe,
-        name=shlex.quote(task.name),
-    )
-    ssh_into(ip, user, ctx, extra_args=["-q"], cmds=[commands], quiet=True)
+)
+
+
+def _task_run(ctx: YoCtx, inst: YoInstance, tasks: t.Sequence[YoTask]) -> None:
+    """
+    Run tasks on an instance. This doesn't check or load dependencies.
+
+    Tasks are started in the order given, batched into as few SSH commands as
+    TASK_RUN_BATCH_BYTES allows. Each one runs in its own subshell, so a task
+    which is already running (or any other early exit) doesn't prevent the rest
+    from starting.
+    """
+    task_dir_safe = ctx.config.task_dir_safe
+    blocks = []
+    for task in tasks:
+        ctx.con.log(
+            f"Start task [blue]{task.name}[/blue] on instance "
+            f"[green]{inst.name}..."
+        )
+        script_text = get_tasklib(task_dir_safe) + task.script
+        heredoc = get_safe_heredoc(script_text)
+        commands = TASK_RUN_TEMPLATE.format(
+            heredoc=heredoc,
+            script_text=script_text,
+            task_dir=task_dir_safe,
+            name=shlex.quote(task.name),
+        )
+        blocks.append(f"(\n{commands}\n)")
+    if not blocks:
+        return
+    # The remote shell receives each command as a single argument, so keep it
+    # well within the kernel's per-argument limit.
+    batches: t.List[t.List[str]] = [[]]
+    batch_size = 0
+    for block in blocks:
+        size = len(block.encode("utf-8")) + 1
+        if batches[-1] and batch_size + size > TASK_RUN_BATCH_BYTES:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append(block)
+        batch_size += size
+    ip = ctx.get_instance_ip(inst, True)
+    user = ctx.get_ssh_user(inst)
+    for batch in batches:
+        commands = "\n".join(batch)
+        ssh_into(ip, user, ctx, extra_args=["-q"], cmds=[commands], quiet=True)
 
 
 def run_all_tasks(
@@ -609,35 +841,43 @@ def run_all_tasks(
     # that will satisfy their dependencies, but the "DEPENDS_ON" function should
     # successfully handle waiting until all depnedencies are completed anyway.
 
-    # 0: not visited, 1: visiting, 2: finished visit
-    name_to_visit: t.Dict[str, int] = collections.defaultdict(int)
-    # output ordering
-    ordered_tasks: t.List[YoTask] = []
-
-    def visit(task_or_name: t.Union[YoTask, str]) -> None:
+    # Load every task we were given, along with all of their dependencies.
+    name_to_task: t.Dict[str, YoTask] = {}
+    to_load: t.Deque[t.Union[YoTask, str]] = collections.deque(tasks)
+    while to_load:
+        task_or_name = to_load.popleft()
         if isinstance(task_or_name, str):
-            name: str = task_or_name
-            task: t.Optional[YoTask] = None
+            if task_or_name in name_to_task:
+                continue
+            task = YoTask.load(task_or_name)
+        elif task_or_name.name in name_to_task:
+            continue
         else:
-            name = task_or_name.name
             task = task_or_name
-        if name_to_visit[name] == 2:
-            # already completed, skip
-            return
-        if name_to_visit[name] == 1:
-            # currently visiting, not a DAG
-            raise YoExc("Tasks express a circular dependency")
-
-        name_to_visit[name] = 1
-        if not task:
-            task = YoTask.load(name)
+        name_to_task[task.name] = task
+        # Don't queue what's already loaded: shared dependencies are common
+        to_load.extend(d for d in task.dependencies if d not in name_to_task)
+
+    # Topologically sort them (Kahn's algorithm). Any task which never reaches
+    # an in-degree of zero is part of (or depends on) a cycle.
+    in_degree = {name: 0 for name in name_to_task}
+    dependents: t.Dict[str, t.List[str]] = collections.defaultdict(list)
+    for task in name_to_task.values():
         for dep_name in task.dependencies:
-            visit(dep_name)
-        name_to_visit[name] = 2
-        ordered_tasks.append(task)
-
-    for name in tasks:
-        visit(name)
+            in_degree[task.name] += 1
+            dependents[dep_name].append(task.name)
+    queue = collections.deque(n for n, d in in_degree.items() if d == 0)
+    ordered_tasks: t.List[YoTask] = []
+    while queue:
+        name = queue.popleft()
+        ordered_tasks.append(name_to_task[name])
+        for dep_name in dependents[name]:
+            in_degree[dep_name] -= 1
+            if in_degree[dep_name] == 0:
+                queue.append(dep_name)
+    if len(ordered_tasks) != len(name_to_task):
+        cycle = ", ".join(sorted(n for n, d in in_degree.items() if d))
+        raise YoExc(f"Tasks express a circular dependency: {cycle}")
 
     # Now ordered_tasks contains the order in which we should launch them.
     # Verify that there are no conflicts
@@ -647,9 +887,10 @@ def run_all_tasks(
             if conflict in all_task_names:
                 raise YoExc(f"Task {task} conflicts with {conflict}")
 
-    # Do the thing!
-    for task in ordered_tasks:
-        _task_run(ctx, inst, task)
+    # Do the thing! Tasks are launched in order, so each task's dependencies
+    # are launched (clearing any old status file, which DEPENDS_ON would
+    # otherwise see) before it is.
+    _task_run(ctx, inst, ordered_tasks)
 
 
 def task_get_status(
@@ -675,47 +916,62 @@ def task_get_status(
         capture_output=True,
         quiet=True,
     )
-    expr = re.compile(r"^.*/([^/]*)/(pid|status|wait):(.*)$")
-    task_to_files: t.Dict[
-        str, t.List[t.Tuple[str, str]]
-    ] = collections.defaultdict(list)
-    output = res.stdout.decode("utf-8").strip()
+    # task -> {kind: contents}: a task has at most one file of each kind
+    task_to_files: t.Dict[str, t.Dict[str, str]] = collections.defaultdict(dict)
+    output = res.stdout.strip()
     if not output:
         return {}
-    for line in output.split("\n"):
-        match = expr.match(line)
-        if not match:
+    # Each line is "TASK_DIR/TASK/KIND:CONTENTS". This is simple enough to
+    # split by hand, which is cheaper than a regex match per line. Split the
+    # raw bytes, and decode the (short) lines individually. The TASK_DIR may
+    # contain anything, including colons, so split from the right.
+    for raw_line in output.split(b"\n"):
+        line = raw_line.decode("utf-8")
+        head, _, tail = line.rpartition("/")
+        kind, sep, stat = tail.partition(":")
+        _, slash, task = head.rpartition("/")
+        if not sep or not slash or not task or kind not in TASK_STATUS_KINDS:
             print(line)
             print(res.stdout)
             raise YoExc(
                 f"bad task status data, examine {ctx.config.task_dir} on the host"
             )
-        task, kind, stat = match.groups()
-        task_to_files[task].append((kind, stat))
+        task_to_files[task][kind] = stat
 
     task_to_status: t.Dict[str, t.Tuple[str, t.Union[str, int]]] = {}
-    for task, stat_list in task_to_files.items():
-        stat_list.sort()  # alphabetical ensures that "wait" is at the end
-        if len(stat_list) == 1:
-            kind, statstr = stat_list[0]
-            stat = int(statstr)
-            if kind == "pid":
-                task_to_status[task] = ("RUNNING", stat)
-            elif stat == 0:
+    for task, files in task_to_files.items():
+        kinds = files.keys()
+        if kinds == {"pid"}:
+            task_to_status[task] = ("RUNNING", int(files["pid"]))
+        elif kinds == {"status"}:
+            if int(files["status"]) == 0:
                 task_to_status[task] = ("SUCCESS", 0)
             else:
                 task_to_status[task] = ("FAIL", 0)
-        elif (
-            len(stat_list) == 2
-            and stat_list[0][0] == "pid"
-            and stat_list[1][0] == "wait"
-        ):
-            task_to_status[task] = ("WAITING", stat_list[1][1])
+        elif kinds == {"pid", "wait"}:
+            task_to_status[task] = ("WAITING", files["wait"])
         else:
             task_to_status[task] = ("UNKNOWN", 0)
     return task_to_status
 
 
+TASK_STATUS_MARKUP = {
+    "RUNNING": "[yellow]RUNNING[/yellow] (pid={})",
+    "FAIL": "[red]FAILED[/red] (code={})",
+    "WAITING": "[green]WAITING[/green] (on={})",
+    "UNKNOWN": "[red]UNKNOWN[/red]",
+}
+TASK_STATUS_MARKUP_DEFAULT = "[green]SUCCESS[/green] (code={})"
+
+
+@lru_cache(maxsize=256)
+def _task_status_markup(status: str, code: t.Union[int, str]) -> str:
+    # Cached: task_join() redraws every task's status on each poll, and the
+    # statuses rarely change between polls.
+    fmt = TASK_STATUS_MARKUP.get(status, TASK_STATUS_MARKUP_DEFAULT)
+    return fmt.format(code)
+
+
 def task_status_to_table(
     statuses: t.Mapping[str, t.Tuple[str, t.Union[int, str]]]
 ) -> rich.table.Table:
@@ -723,17 +979,7 @@ def task_status_to_table(
     t.add_column("Task")
     t.add_column("Status")
     for task, (status, code) in statuses.items():
-        if status == "RUNNING":
-            status = f"[yellow]RUNNING[/yellow] (pid={code})"
-        elif status == "FAIL":
-            status = f"[red]FAILED[/red] (code={code})"
-        elif status == "WAITING":
-            status = f"[green]WAITING[/green] (on={code})"
-        elif status == "UNKNOWN":
-            status = "[red]UNKNOWN[/red]"
-        else:
-            status = f"[green]SUCCESS[/green] (code={code})"
-        t.add_row(task, status)
+        t.add_row(task, _task_status_markup(status, code))
     return t
 
 
@@ -742,21 +988,28 @@ def task_join(
     inst: YoInstance,
     wait_task: t.Optional[str] = None,
 ) -> t.Mapping[str, t.Tuple[str, t.Union[str, int]]]:
+    # Each poll is an SSH command (multiplexed over one connection, see
+    # SSH_MULTIPLEX_OPTIONS). Back off while nothing changes, but poll quickly
+    # again as soon as something does.
+    delay = TASK_POLL_MIN_SEC
     with Live(console=ctx.con) as live:
         task_previous_status: t.Dict[str, str] = {}
         while True:
             status_dict = task_get_status(ctx, inst)
             live.update(task_status_to_table(status_dict))
             any_running = False
+            changed = False
             for task, (status, _) in status_dict.items():
                 prev_status = task_previous_status.get(task)
                 task_previous_status[task] = status
                 if not prev_status:
                     live.console.log(f"{task}: starting in status {status}")
+                    changed = True
                 elif prev_status != status:
                     live.console.log(
                         f"{task}: changing status {prev_status} -> {status}"
                     )
+                    changed = True
                 if status in ("RUNNING", "WAITING"):
                     any_running = True
 
@@ -773,7 +1026,10 @@ def task_join(
             )
             if can_terminate:
                 break
-            time.sleep(1)
+            if changed:
+                delay = TASK_POLL_MIN_SEC
+            time.sleep(delay)
+            delay = min(delay * 2, TASK_POLL_MAX_SEC)
     return status_dict
 
 
@@ -783,6 +1039,51 @@ class YoCmd(subc.Command):
     rootname = "yo"
     help_formatter_class = ParagraphFormatter  # type: ignore
 
+    # Bumped whenever a subclass is defined, to invalidate _command_cache
+    _command_version = 0
+    _command_cache: t.Dict[t.Type["YoCmd"], t.Tuple[int, t.List[t.Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        YoCmd._command_version += 1
+        # Each add_args() is wrapped, so that it may be deferred until the
+        # command's parser is used. See LazyArgumentParser.
+        if "add_args" in cls.__dict__:
+            cls.add_args = _defer_add_args(cls.__dict__["add_args"])  # type: ignore
+
+    @classmethod
+    def command_classes(cls) -> t.List[t.Any]:
+        """
+        Return the leaf command classes beneath this class (in BFS order)
+
+        The walk over __subclasses__() is cached until a new subclass is
+        defined, so repeated calls (e.g. from tests) only pay for it once.
+        """
+        cached = YoCmd._command_cache.get(cls)
+        if cached and cached[0] == YoCmd._command_version:
+            return cached[1]
+        # A plain list used as a queue: the tree is shallow, and walking it by
+        # index keeps the BFS order (which is the order in "yo help").
+        leaves = []
+        subclasses = cls.__subclasses__()
+        i = 0
+        while i < len(subclasses):
+            subcls = subclasses[i]
+            i += 1
+            this_node_subclasses = subcls.__subclasses__()
+            if this_node_subclasses:
+                subclasses.extend(this_node_subclasses)
+            else:
+                leaves.append(subcls)
+        YoCmd._command_cache[cls] = (YoCmd._command_version, leaves)
+        return leaves
+
+    @classmethod
+    def iter_commands(cls) -> t.Iterator[t.Any]:
+        # subc expects instances, so instantiate from the cached classes
+        for subcls in cls.command_classes():
+            yield subcls()
+
     @classmethod
     def setup_config(cls) -> t.Tuple[YoCtx, t.Dict[str, str]]:
         check_configs()
@@ -1456,6 +1757,7 @@ class RemoteDesktopCommand(SingleInstanceCommand):
                 self.c,
                 f"{user}@{ip}",
                 [f"-NL{self.PORT}:localhost:{self.PORT}"],
+                interactive=False,
             )
             ssh_tunnel = subprocess.Popen(cmd)
             try:
@@ -1614,7 +1916,13 @@ class ConsoleCmd(SingleInstanceCommand):
                 "yo bug, please report it on Github."
             )
 
-        cmd = ssh_cmd(self.c, target, SSH_CONSOLE_OPTIONS, processed_args)
+        cmd = ssh_cmd(
+            self.c,
+            target,
+            SSH_CONSOLE_OPTIONS,
+            processed_args,
+            interactive=True,
+        )
 
         self.c.con.log("About to execute:")
         self.c.con.log(cmd)
@@ -1806,6 +2114,10 @@ class TaskInfo(YoCmd):
         self.c.con.print(f"Dependencies: {', '.join(task.dependencies)}")
         self.c.con.print(f"Conflicts: {', '.join(task.conflicts)}")
         self.c.con.print("\nScript:")
+        # rich.syntax pulls in pygments, which is slow to import: only load it
+        # for the one command which highlights code.
+        import rich.syntax
+
         s = rich.syntax.Syntax(task.script, "bash", theme="ansi_light")
         self.c.con.print(s)
 
@@ -2701,8 +3013,12 @@ class RebuildCmd(YoCmd):
         if self.args.wait or self.args.ssh:
             self.c.wait_instance_state(inst.id, "RUNNING")
         if self.args.ssh:
-            ip = self.c.get_instance_ip(inst)
-            user = self.c.get_ssh_user(inst)
+            # The IP lookup and user lookup (which may need to fetch the image)
+            # are independent API calls, so run them concurrently.
+            ip_fut = self.c._tpe.submit(self.c.get_instance_ip, inst)
+            user_fut = self.c._tpe.submit(self.c.get_ssh_user, inst)
+            ip = ip_fut.result()
+            user = user_fut.result()
             if not wait_for_ssh_access(ip, user, self.c):
                 self.c.con.log("[red]Could not connect via SSH")
                 self.c.con.log("Maybe you're not connected to VPN?")
@@ -2715,7 +3031,11 @@ class OsCmd(YoCmd):
     description = "List official OS and version combinations."
 
     def run(self) -> None:
-        images = self.c.list_official_images()
+        # The set of official OS versions changes rarely, so a day-old image
+        # cache is more than good enough here.
+        images = self.c.list_official_images(
+            stale_thresh=datetime.timedelta(hours=24)
+        )
         names = sorted(set(f"{i.os}:{i.os_version}" for i in images))
         self.c.con.print("\n".join(names))
 
@@ -2797,22 +3117,22 @@ class ShapesCmd(YoCmd):
             table.add_column("CPU Info")
 
     def add_row(self, shape: YoShape, table: rich.table.Table) -> None:
-        fields = [
+        extras: t.Tuple[str, ...]
+        if self.args.disk:
+            extras = (str(shape.local_disks), shape.local_disk_description)
+        elif self.args.gpu:
+            extras = (shape.gpu_description,)
+        else:
+            extras = (shape.processor_description,)
+        table.add_row(
             shape.shape,
             str(shape.memory_in_gbs),
             str(shape.ocpus),
             str(shape.gpus),
             str(shape.networking_bandwidth_in_gbps),
             str(shape.local_disks_total_size_in_gbs or 0),
-        ]
-        if self.args.disk:
-            fields.append(str(shape.local_disks))
-            fields.append(shape.local_disk_description)
-        elif self.args.gpu:
-            fields.append(shape.gpu_description)
-        else:
-            fields.append(shape.processor_description)
-        table.add_row(*fields)
+            *extras,
+        )
 
     def show_avail(self) -> None:
         shapes = list(self.filtered_shapes())
@@ -3448,38 +3768,70 @@ def detach_volume_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _unmount_iscsi_volumes(
+    ctx: YoCtx,
+    instance_id: str,
+    vas: t.List[YoVolumeAttachment],
+) -> None:
+    inst = ctx.get_instance_by_id(instance_id)
+    ctx.con.log(f"Running commands to unmount iSCSI volume on {inst.name}...")
+    ip = ctx.get_instance_ip(inst)
+    user = ctx.get_ssh_user(inst)
+    commands: t.List[str] = []
+    for va in vas:
+        _, detach = ctx.get_attachment_commands(va)
+        commands.extend(detach)
+    res = ssh_into(
+        ip,
+        user,
+        ctx,
+        extra_args=["-q"],
+        cmds=[" && ".join(commands)],
+        capture_output=True,
+        quiet=True,
+    )
+    if res.returncode != 0:
+        print(res.stderr)
+        raise YoExc(
+            "failed to unmount on host, your volume has not been detached"
+        )
+    ctx.con.log(f"Unmounted on {inst.name}!")
+
+
 def do_detach_volume(
     ctx: YoCtx,
     args: argparse.Namespace,
     detach_vas: t.List[YoVolumeAttachment],
 ) -> None:
+    # Group the attachments by instance. The iSCSI volumes on each instance
+    # are unmounted with a single SSH session, and the instances are handled
+    # concurrently. Each instance's volumes are detached once they have been
+    # unmounted.
+    by_instance: t.Dict[
+        str, t.List[YoVolumeAttachment]
+    ] = collections.defaultdict(list)
     for detach_va in detach_vas:
-        if args.teardown and detach_va.attachment_type == AttachmentType.ISCSI:
-            inst = ctx.get_instance_by_id(detach_va.instance_id)
-            ctx.con.log(
-                f"Running commands to unmount iSCSI volume on {inst.name}..."
-            )
-            ip = ctx.get_instance_ip(inst)
-            user = ctx.get_ssh_user(inst)
-            _, detach = ctx.get_attachment_commands(detach_va)
-            res = ssh_into(
-                ip,
-                user,
-                ctx,
-                extra_args=["-q"],
-                cmds=[" && ".join(detach)],
-                capture_output=True,
-                quiet=True,
-            )
-            if res.returncode != 0:
-                print(res.stderr)
-                raise YoExc(
-                    "failed to unmount on host, your volume has not been detached"
+        by_instance[detach_va.instance_id].append(detach_va)
+    unmounts: t.Dict[str, "concurrent.futures.Future[None]"] = {}
+    if args.teardown:
+        for inst_id, vas in by_instance.items():
+            iscsi_vas = [
+                va for va in vas if va.attachment_type == AttachmentType.ISCSI
+            ]
+            if iscsi_vas:
+                unmounts[inst_id] = ctx._tpe.submit(
+                    _unmount_iscsi_volumes, ctx, inst_id, iscsi_vas
                 )
-            ctx.con.log("Unmounted!")
-        ctx.detach_volume(detach_va)
-    for detach_va in detach_vas:
-        ctx.wait_attachment(detach_va, "DETACHED")
+    for inst_id, vas in by_instance.items():
+        if inst_id in unmounts:
+            unmounts[inst_id].result()
+        for detach_va in vas:
+            ctx.detach_volume(detach_va)
+    if ctx.config.parallel_waits and len(detach_vas) > 1:
+        ctx.wait_attachments(detach_vas, "DETACHED")
+    else:
+        for detach_va in detach_vas:
+            ctx.wait_attachment(detach_va, "DETACHED")
 
 
 class DetachCmd(YoCmd):
@@ -3494,7 +3846,8 @@ class DetachCmd(YoCmd):
             self.complete_volume,
             "volume",
             type=str,
-            help="name of volume to detach",
+            nargs="+",
+            help="name of volume(s) to detach",
         )
         self.add_with_completer(
             parser,
@@ -3514,13 +3867,13 @@ class DetachCmd(YoCmd):
     def run(self) -> None:
         if self.args.all and self.args.from_instance:
             raise YoExc("--from and --all are mutually exclusive")
-        name = standardize_name(
-            self.args.volume, self.args.exact_name, self.c.config
-        )
-        vol = self.c.get_volume(name)
-        vas = self.c.attachments_by_volume()[vol.id]
-        vas = [va for va in vas if va.state == "ATTACHED"]
-        detach_vas = []
+        names = [
+            standardize_name(v, self.args.exact_name, self.c.config)
+            for v in self.args.volume
+        ]
+        vols = self.c.get_volumes(names)
+        vas_by_volume = self.c.attached_attachments_by_volume()
+        inst = None
         if self.args.from_instance:
             inst = self.c.get_instance_by_name(
                 self.args.from_instance,
@@ -3528,20 +3881,28 @@ class DetachCmd(YoCmd):
                 (),
                 exact_name=self.args.exact_name,
             )
-            for va in vas:
-                if va.instance_id == inst.id:
-                    detach_vas.append(va)
-                    break
-            else:
+        detach_vas = []
+        for vol in vols:
+            vas = vas_by_volume[vol.id]
+            if inst:
+                for va in vas:
+                    if va.instance_id == inst.id:
+                        detach_vas.append(va)
+                        break
+                else:
+                    raise YoExc(
+                        f"volume {vol.name} is not attached to instance "
+                        f"{inst.name}"
+                    )
+            elif len(vas) > 1 and not self.args.all:
                 raise YoExc(
-                    f"volume {vol.name} is not attached to instance {inst.name}"
+                    f"volume {vol.name} is attached to multiple instances, "
+                    "use --from or --all"
                 )
-        elif len(vas) > 1 and not self.args.all:
-            raise YoExc("Attached to multiple instances, use --from or --all")
-        elif vas:
-            detach_vas = vas
-        else:
-            raise YoExc(f"volume {vol.name} has no current attachments")
+            elif vas:
+                detach_vas.extend(vas)
+            else:
+                raise YoExc(f"volume {vol.name} has no current attachments")
 
         do_detach_volume(self.c, self.args, detach_vas)
 
@@ -3557,7 +3918,8 @@ class VolumeDeleteCmd(YoCmd):
             self.complete_volume,
             "name",
             type=str,
-            help="name of volume to delete",
+            nargs="+",
+            help="name of volume(s) to delete",
         )
         parser.add_argument(
             "--no-detach",
@@ -3569,16 +3931,18 @@ class VolumeDeleteCmd(YoCmd):
         detach_volume_args(parser)
 
     def run(self) -> None:
-        name = standardize_name(
-            self.args.name, self.args.exact_name, self.c.config
-        )
-        volume = self.c.get_volume(name)
-        vas = self.c.attachments_by_volume()[volume.id]
-        vas = [va for va in vas if va.state == "ATTACHED"]
+        names = [
+            standardize_name(n, self.args.exact_name, self.c.config)
+            for n in self.args.name
+        ]
+        volumes = self.c.get_volumes(names)
         if self.args.detach:
+            vas_by_volume = self.c.attached_attachments_by_volume()
+            vas = [va for vol in volumes for va in vas_by_volume[vol.id]]
             do_detach_volume(self.c, self.args, vas)
-        self.c.delete_volume(volume)
-        self.c.con.log("Deleted!")
+        for volume in volumes:
+            self.c.delete_volume(volume)
+            self.c.con.log(f"Deleted {volume.name}!")
 
 
 class RenameCmd(SingleInstanceCommand):
@@ -3599,11 +3963,7 @@ class RenameCmd(SingleInstanceCommand):
         new_name = standardize_name(
             self.args.new_name, self.args.exact_name, self.c.config
         )
-        instances = self.c.list_instances()
-        non_terminated_names = {
-            inst.name for inst in instances if inst.state != "TERMINATED"
-        }
-        if new_name in non_terminated_names:
+        if self.c.instance_exists(new_name):
             raise YoExc(f"The name {new_name} is already in use")
         self.c.rename_instance(instance, new_name)
 
@@ -3636,7 +3996,17 @@ class ConsoleHistoryCmd(SingleInstanceCommand):
     description = "Fetch and print serial console history for an instance."
 
     def run_for_instance(self, instance: YoInstance) -> None:
-        print(self.c.get_console_history(instance).decode())
+        history = self.c.get_console_history(instance)
+        # Console history can be large. Write the bytes directly, rather than
+        # making a decoded copy, unless stdout doesn't expose a byte stream.
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            print(history.decode(errors="replace"))
+            return
+        sys.stdout.flush()
+        out.write(history)
+        out.write(b"\n")
+        out.flush()
 
 
 class MoshCmd(SingleInstanceCommand):
@@ -3668,18 +4038,25 @@ class CacheCleanCmd(YoCmd):
     group = "Diagnostic Commands"
     description = "Clear Yo's caches -- a good first troubleshooting step."
 
+    # Matches yo.json (the legacy cache) and yo.REGION.json
+    CACHE_FILE_RE = re.compile(r"^yo(?:\.[^.]+)?\.json$")
+
     def run(self) -> None:
-        regions = set(self.c.config.regions.keys())
-        regions.add(self.c.config.region)
-        files = [
-            os.path.expanduser(f"~/.cache/yo.{region}.json")
-            for region in regions
-        ]
-        files.append(os.path.expanduser("~/.cache/yo.json"))
-        for file in files:
-            if os.path.isfile(file):
-                print(f"cleaned {file}")
-                os.unlink(file)
+        # Scan the directory once rather than checking for each region's file,
+        # which also catches caches of regions no longer in the config.
+        cache_dir = os.path.expanduser("~/.cache")
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if not self.CACHE_FILE_RE.match(entry.name):
+                continue
+            # Another yo process may remove the file first: not an error.
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry.path)
+                print(f"cleaned {entry.path}")
 
 
 class HelpCmd(YoCmd):
@@ -3728,13 +4105,12 @@ def _extend() -> None:
     # older API. However, the API was _transitional_ in 3.8 and 3.9, and it is
     # different enough to break callers compared to the non-transitional API. So
     # here we are, using sys.version_info like heathens.
+    # On older versions, use the importlib_metadata backport, which provides
+    # the same API. The pkg_resources alternative is very slow to import.
     if sys.version_info >= (3, 10):
         from importlib.metadata import entry_points  # novermin
     else:
-        import pkg_resources
-
-        def entry_points(group: str) -> t.Iterable["pkg_resources.EntryPoint"]:
-            return pkg_resources.iter_entry_points(group)
+        from importlib_metadata import entry_points
 
     for entry_point in entry_points(group="yo.extensions.v1"):
         entry_point.load()
@@ -3749,14 +4125,21 @@ def _old_extension_modules(ctx: YoCtx) -> None:
 
 
 def main() -> None:
-    os.environ["OCI_PYTHON_SDK_NO_SERVICE_IMPORTS"] = "True"
+    ctx: t.Optional[YoCtx] = None
+
+    def error_console() -> rich.console.Console:
+        # Reuse the context's console when we got far enough to create it
+        if ctx is not None:
+            return ctx.con
+        return rich.console.Console()
+
     try:
         desc = (
             "A simple OCI client. Use 'yo help' for an overview, or yo -h "
             "for a listing of each command. For a help on a particular "
             "command, use 'yo COMMAND -h'."
         )
-        parser = argparse.ArgumentParser(description=desc)
+        parser = LazyArgumentParser(description=desc)
         parser.add_argument(
             "--region",
             "-r",
@@ -3781,11 +4164,11 @@ def main() -> None:
         with ctx:
             ns.func(ns)
     except YoExc as e:
-        con = rich.console.Console()
+        con = error_console()
         con.print(f"[bold red]error: {e.args[0]}")
         sys.exit(1)
     except ServiceError as e:
-        con = rich.console.Console()
+        con = error_console()
         con.print("[bold red]-- error: cut here when reporting --")
         tb = traceback.format_exc()
         con.print(Text(tb, style="dim italic"))
@@ -3802,9 +4185,11 @@ def build_parser_functions() -> None:
     # automatic documentation generation for commands
     g = globals()
     trans = str.maketrans(" -", "__")
-    for cmd in YoCmd.iter_commands():
-        name = cmd.name.translate(trans)
-        g[f"cmd_{name}_args"] = cmd.simple_sub_parser
+    for cmd_cls in YoCmd.command_classes():
+        # Command metadata lives on the class: only instantiate the command
+        # when its parser is actually requested.
+        name = cmd_cls.name.translate(trans)
+        g[f"cmd_{name}_args"] = lambda c=cmd_cls: c().simple_sub_parser()
 
 
 if __name__ == "__main__":
@@ -43,15 +43,15 @@ you run "import oci", unless you set an environment variable to disable this
 
 https://docs.oracle.com/en-us/iaas/tools/python/2.79.0/sdk_behaviors/enable_selective_service_imports.html
 
-We now set this environment variable in yo.main.main, and since the yo.oci
-module is lazily loaded (very much on purpose), that will take effect before any
-of the imports here.
+We now set this environment variable in the yo package's __init__.py, so it
+takes effect before any of the imports here (or anywhere else).
 
 However, the 100 milliseconds it takes to load the relevant OCI modules probably
 aren't important, so the design decision to stuff all the OCI imports into a
 separate module is no longer a great one. In the future, I may get rid of this
 monstrosity and need to set the environment variable at the top of the script.
 """
+import concurrent.futures
 import time
 import typing as t
 
@@ -89,6 +89,66 @@ from yo.api import YoCtx
 __all__ = ["oci"]
 
 
+def _new_progress(ctx: YoCtx) -> Progress:
+    return Progress(
+        rich.progress.TextColumn("{task.description}"),
+        rich.progress.SpinnerColumn(),
+        rich.progress.TimeElapsedColumn(),
+        rich.progress.TextColumn("Timeout in:"),
+        rich.progress.TimeRemainingColumn(),
+        console=ctx.con,
+    )
+
+
+def _item_str(item: Response, display_name: t.Optional[str]) -> str:
+    item_kind = type(item.data).__name__
+    if display_name:
+        return f"{item_kind} [blue]{display_name}[/blue]"
+    else:
+        return f"{item_kind}"
+
+
+def _wait_with_task(
+    ctx: YoCtx,
+    progress: Progress,
+    task: rich.progress.TaskID,
+    client: t.Any,
+    item: Response,
+    attr: str,
+    state: str,
+    item_str: str,
+    max_wait_seconds: int,
+    wait_callback: t.Optional[t.Callable[[int, Response], None]],
+) -> Response:
+    start = time.monotonic()
+    last_state = getattr(item.data, attr)
+    ctx.con.log(f"Wait for {item_str} to enter state [purple]{state}")
+    ctx.con.log(f"{item_str} starts in state [purple]{last_state}")
+
+    def update(check_count: int, last_response: Response) -> None:
+        nonlocal last_state
+        progress.update(task, completed=time.monotonic() - start)
+        current_state = getattr(last_response.data, attr)
+        if current_state != last_state:
+            progress.print(f"{item_str} entered state [purple]{current_state}")
+        last_state = current_state
+        if wait_callback:
+            wait_callback(check_count, last_response)
+
+    resp: Response = wait_until(
+        client,
+        item,
+        attr,
+        state,
+        max_interval_seconds=1,
+        max_wait_seconds=max_wait_seconds,
+        wait_callback=update,
+    )
+    progress.update(task, completed=max_wait_seconds)
+    ctx.con.log(f"{item_str} has reached state [purple]{state}!")
+    return resp
+
+
 def wait_until_progress(
     ctx: YoCtx,
     client: t.Any,
@@ -100,52 +160,72 @@ def wait_until_progress(
     wait_callback: t.Optional[t.Callable[[int, Response], None]] = None,
     display_name: t.Optional[str] = None,
 ) -> Response:
-    progress = Progress(
-        rich.progress.TextColumn("{task.description}"),
-        rich.progress.SpinnerColumn(),
-        rich.progress.TimeElapsedColumn(),
-        rich.progress.TextColumn("Timeout in:"),
-        rich.progress.TimeRemainingColumn(),
-        console=ctx.con,
-    )
+    progress = _new_progress(ctx)
     with progress:
         task = progress.add_task(
             "WAIT", start=True, total=max_wait_seconds, finished_time=1
         )
-        start = time.time()
-        last_update = start
-        last_state = getattr(item.data, attr)
-        item_kind = type(item.data).__name__
-        if display_name:
-            item_str = f"{item_kind} [blue]{display_name}[/blue]"
-        else:
-            item_str = f"{item_kind}"
-        ctx.con.log(f"Wait for {item_str} to enter state [purple]{state}")
-        ctx.con.log(f"{item_str} starts in state [purple]{last_state}")
-
-        def update(check_count: int, last_response: Response) -> None:
-            nonlocal last_update, last_state
-            current = time.time()
-            progress.advance(task, current - last_update)
-            last_update = current
-            current_state = getattr(last_response.data, attr)
-            if current_state != last_state:
-                progress.print(
-                    f"{item_str} entered state [purple]{current_state}"
-                )
-            last_state = current_state
-            if wait_callback:
-                wait_callback(check_count, last_response)
-
-        resp: Response = wait_until(
+        return _wait_with_task(
+            ctx,
+            progress,
+            task,
             client,
             item,
             attr,
             state,
-            max_interval_seconds=1,
-            max_wait_seconds=max_wait_seconds,
-            wait_callback=update,
+            _item_str(item, display_name),
+            max_wait_seconds,
+            wait_callback,
         )
-        progress.advance(task, max_wait_seconds)
-    ctx.con.log(f"{item_str} has reached state [purple]{state}!")
-    return resp
+
+
+class WaitItem(t.NamedTuple):
+    client: t.Any
+    item: Response
+    attr: str
+    state: str
+    display_name: t.Optional[str] = None
+
+
+def wait_until_progress_many(
+    ctx: YoCtx,
+    items: t.Sequence[WaitItem],
+    executor: concurrent.futures.Executor,
+    max_wait_seconds: int = 600,
+) -> t.List[Response]:
+    """
+    Wait for several resources concurrently, with a single progress display
+
+    Each item is polled by a task submitted to the executor, and gets its own
+    row in the progress display. The responses are returned in the same order
+    as the items.
+    """
+    if not items:
+        return []
+    progress = _new_progress(ctx)
+    with progress:
+        futures = []
+        for wi in items:
+            item_str = _item_str(wi.item, wi.display_name)
+            task = progress.add_task(
+                wi.display_name or "WAIT",
+                start=True,
+                total=max_wait_seconds,
+                finished_time=1,
+            )
+            futures.append(
+                executor.submit(
+                    _wait_with_task,
+                    ctx,
+                    progress,
+                    task,
+                    wi.client,
+                    wi.item,
+                    wi.attr,
+                    wi.state,
+                    item_str,
+                    max_wait_seconds,
+                    None,
+                )
+            )
+        return [f.result() for f in futures]
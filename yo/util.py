@@ -46,6 +46,9 @@ from pathlib import Path
 
 T = t.TypeVar("T")
 
+# Separator for string lists in the config file (see opt_strlist)
+STRLIST_SPLIT_RE = re.compile(r"[,\s]+", re.M)
+
 
 class YoExc(Exception):
     pass
@@ -64,7 +67,7 @@ def opt_strlist(opts: t.Dict[str, t.Any], field: str) -> None:
     """
     val = t.cast(t.Optional[str], opts.get(field))
     if val:
-        opts[field] = re.split(r"[,\s]+", val.strip(), flags=re.M)
+        opts[field] = STRLIST_SPLIT_RE.split(val.strip())
 
 
 def filter_keys(
@@ -140,6 +143,8 @@ class YoConfig:
     list_columns: str = "Name,Shape,Mem,CPU,State,Created"
     allow_hash_in_config_value: bool = False
     allow_legacy_imds_endpoints: bool = False
+    parallel_waits: bool = True
+    ssh_port_probe: bool = False
 
     @property
     def vcn_id(self) -> str:
@@ -155,8 +160,12 @@ class YoConfig:
 
     @property
     def ssh_public_key_full(self) -> str:
-        path = os.path.expanduser(self.ssh_public_key)
-        return open(path).read()
+        # Read the key file only once, no matter how many times it's used.
+        if not hasattr(self, "_ssh_public_key_full"):
+            path = os.path.expanduser(self.ssh_public_key)
+            with open(path) as f:
+                self._ssh_public_key_full: str = f.read()
+        return self._ssh_public_key_full
 
     @property
     def task_dir_safe(self) -> str:
@@ -178,6 +187,11 @@ class YoConfig:
         :param task_dir: the configured task_dir
         :returns: a final escaped shell token that represents the task_dir
         """
+        if not hasattr(self, "_task_dir_safe"):
+            self._task_dir_safe: str = self._compute_task_dir_safe()
+        return self._task_dir_safe
+
+    def _compute_task_dir_safe(self) -> str:
         task_dir = self.task_dir.rstrip("/")
         use_home = False
         if task_dir.startswith("~"):
@@ -193,12 +207,15 @@ class YoConfig:
 
     @property
     def ssh_private_key(self) -> t.Union[Path, None]:
-        private_key = Path(removesuffix(self.ssh_public_key, ".pub"))
-        private_key = private_key.expanduser()
-        if private_key.exists():
-            return private_key
-        else:
-            return None
+        # This is used each time an SSH command line is built, so avoid
+        # repeating the path processing and the filesystem check.
+        if not hasattr(self, "_ssh_private_key"):
+            private_key = Path(removesuffix(self.ssh_public_key, ".pub"))
+            private_key = private_key.expanduser()
+            self._ssh_private_key: t.Optional[Path] = (
+                private_key if private_key.exists() else None
+            )
+        return self._ssh_private_key
 
     @classmethod
     def from_config_section(
@@ -226,6 +243,8 @@ class YoConfig:
             "resource_filtering",
             "allow_hash_in_config_value",
             "allow_legacy_imdc_endpoints",
+            "parallel_waits",
+            "ssh_port_probe",
         ]
         for b in bools:
             if b in d:
@@ -354,16 +373,19 @@ PYPI_URL = "https://pypi.org/simple/yo/"
 UPGRADE_COMMAND = "pip install --upgrade yo"
 
 
+_PYPI_VERSION_RE = re.compile(r"yo-(\d+)\.(\d+)\.(\d+)")
+
+
 def latest_yo_version() -> t.Optional[t.Tuple[int, int, int]]:
     try:
         with urllib.request.urlopen(PYPI_URL, timeout=5) as response:
             html = response.read().decode("utf-8")
-        expr = re.compile(r"yo-(\d+)\.(\d+)\.(\d+)")
         return max(
-            [
-                (int(m.group(1)), int(m.group(2)), int(m.group(3)))
-                for m in expr.finditer(html)
-            ]
+            (
+                (int(g1), int(g2), int(g3))
+                for g1, g2, g3 in _PYPI_VERSION_RE.findall(html)
+            ),
+            default=None,
         )
     except Exception:
         return None